@@ -1,23 +1,102 @@
 # Receipt Vault Analyzer - Enhanced Dashboard UI
 import streamlit as st  # type: ignore
 import pandas as pd  # type: ignore
-import plotly.express as px  # type: ignore
-from database.queries import fetch_all_receipts, search_receipts, delete_receipt  # type: ignore
-from ai.insights import generate_ai_insights  # type: ignore
+import pyarrow as pa  # type: ignore
+from database.queries import fetch_all_receipts, search_receipts, delete_receipts  # type: ignore
 from config.config import CURRENCY_SYMBOL  # type: ignore
 from datetime import datetime  # type: ignore
 import io  # type: ignore
-from reportlab.lib.pagesizes import letter, A4  # type: ignore
-from reportlab.lib import colors  # type: ignore
-from reportlab.lib.units import inch  # type: ignore
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer  # type: ignore
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle  # type: ignore
-from reportlab.lib.enums import TA_CENTER  # type: ignore
 from config.translations import get_text, TRANSLATIONS # type: ignore
 
+# reportlab/openpyxl are imported lazily inside the export paths -
+# they cost tens of ms at import time but are only needed on download
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+
+@st.cache_data(ttl=60)
+def _load_receipts_df():
+    """
+    Cached receipts DataFrame so filter keystrokes/reruns reuse the
+    same frame instead of hitting the DB every time.
+    Cleared after save/delete so fresh data shows up immediately.
+    """
+    receipts = fetch_all_receipts()
+    if not receipts:
+        return pd.DataFrame()
+
+    # One C++ pass over the list of dicts - much faster than
+    # pd.DataFrame's object-array construction path, and the Arrow
+    # types carry through to pandas (string kernels, compact buffers)
+    tbl = pa.Table.from_pylist(receipts)
+    date_idx = tbl.schema.get_field_index("date")
+    try:
+        tbl = tbl.set_column(date_idx, "date", tbl.column("date").cast(pa.timestamp("s")))
+        df = tbl.to_pandas(types_mapper=pd.ArrowDtype)
+    except pa.ArrowInvalid:
+        # Stored dates aren't all strict ISO (e.g. non-zero-padded
+        # "2024-5-7" from template parsing, or empty strings) - fall
+        # back to pandas' lenient parser like the baseline did
+        df = tbl.to_pandas(types_mapper=pd.ArrowDtype)
+        df["date"] = pd.to_datetime(df["date"])
+
+    # Lowercased helpers computed once per cache fill so substring
+    # filters don't re-lowercase full columns on every rerun.
+    # Dropped before display/export.
+    df["_bill_lc"] = df["bill_id"].str.lower()
+    df["_vendor_lc"] = df["vendor"].str.lower()
+    return df
+
+
+# Content-based DataFrame fingerprint for the export caches: the
+# ordered bill_ids distinguish adds, deletes and different filter
+# results, unlike a row-count/newest-id pair which can collide
+_df_fingerprint = {
+    pd.DataFrame: lambda d: tuple(d["bill_id"])
+}
+
+
+@st.cache_data(hash_funcs=_df_fingerprint)
+def _csv_bytes(df) -> bytes:
+    """Cached CSV export so reruns don't re-serialize unchanged data."""
+    # Format dates explicitly so both dashboard branches (Arrow-backed
+    # loader vs datetime64 search path) emit the baseline YYYY-MM-DD
+    df = df.assign(date=df["date"].dt.strftime("%Y-%m-%d"))
+    # Encode while writing - skips the intermediate full-size str that
+    # to_csv()+.encode() would allocate
+    buf = io.BytesIO()
+    wrapper = io.TextIOWrapper(buf, encoding="utf-8", newline="")
+    df.to_csv(wrapper, index=False)
+    wrapper.flush()
+    return buf.getvalue()
+
+
+@st.cache_data(hash_funcs=_df_fingerprint)
+def _json_bytes(df) -> bytes:
+    """Cached JSON export so reruns don't re-serialize unchanged data."""
+    # Explicit date formatting keeps the output identical whichever
+    # branch built the frame; missing values become JSON null
+    records_df = df.assign(date=df["date"].dt.strftime("%Y-%m-%dT%H:%M:%S"))
+    records_df = records_df.astype(object).where(pd.notna(records_df), None)
+    if orjson is None:
+        # Fallback: pandas' built-in (slower) JSON writer
+        return records_df.to_json(orient="records", indent=2).encode("utf-8")
+    return orjson.dumps(records_df.to_dict(orient="records"), option=orjson.OPT_INDENT_2)
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_df_fingerprint)
+def generate_pdf_report(df, lang="en") -> bytes:
+    """Generate PDF report bytes from dataframe (cached across reruns)"""
+    from reportlab.lib.pagesizes import A4  # type: ignore
+    from reportlab.lib import colors  # type: ignore
+    from reportlab.lib.units import inch  # type: ignore
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak  # type: ignore
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle  # type: ignore
+    from reportlab.lib.enums import TA_CENTER  # type: ignore
 
-def generate_pdf_report(df, lang="en"):
-    """Generate PDF report from dataframe"""
     buffer = io.BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=30, leftMargin=30, topMargin=30, bottomMargin=18)
     
@@ -72,26 +151,33 @@ def generate_pdf_report(df, lang="en"):
     
     # Receipts Table
     if not df.empty:
+        # Format whole columns at once instead of per-row via iterrows
         table_data = [[get_text(lang, 'date'), get_text(lang, 'vendor'), 'Amount']]
-        for _, row in df.iterrows():
-            table_data.append([
-                row['date'].strftime('%Y-%m-%d') if pd.notna(row['date']) else 'N/A',
-                str(row['vendor'])[:20],
-                f"₹{row['amount']:,.2f}"
-            ])
+        dates = df['date'].dt.strftime('%Y-%m-%d').fillna('N/A')
+        vendors = df['vendor'].astype(str).str.slice(0, 20)
+        amounts = '₹' + df['amount'].map('{:,.2f}'.format)
+        table_data.extend(zip(dates, vendors, amounts))
         
-        receipt_table = Table(table_data, colWidths=[2*inch, 3*inch, 2*inch])
-        receipt_table.setStyle(TableStyle([
+        receipt_style = TableStyle([
             ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#764ba2')),
             ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
             ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
             ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-        ]))
-        elements.append(receipt_table)
+        ])
+        # One bounded Table per page - a single giant Table makes
+        # reportlab's layout pass quadratic in the row count
+        header = table_data[0]
+        rows_per_page = 40
+        for i in range(1, len(table_data), rows_per_page):
+            chunk = [header] + table_data[i:i + rows_per_page]
+            receipt_table = Table(chunk, colWidths=[2*inch, 3*inch, 2*inch], repeatRows=1)
+            receipt_table.setStyle(receipt_style)
+            elements.append(receipt_table)
+            if i + rows_per_page < len(table_data):
+                elements.append(PageBreak())
     
     doc.build(elements)
-    buffer.seek(0)
-    return buffer
+    return buffer.getvalue()
 
 
 def render_dashboard():
@@ -133,17 +219,24 @@ def render_dashboard():
             start_date=s_date_str # Simple exact match or start match logic in query
         )
         st.caption(f"Found {len(receipts)} matching receipts")
+        if not receipts:
+            st.info(get_text(lang, "no_receipts_found"))
+            return
+        df = pd.DataFrame(receipts)
+        df["date"] = pd.to_datetime(df["date"])
     else:
-        receipts = fetch_all_receipts()
+        df = _load_receipts_df()
+        if df.empty:
+            st.info(get_text(lang, "no_receipts_found"))
+            return
+        df = df.drop(columns=["_bill_lc", "_vendor_lc"], errors="ignore")
 
-    if not receipts:
-        st.info(get_text(lang, "no_receipts_found"))
-        return
-
-    df = pd.DataFrame(receipts)
-    df["date"] = pd.to_datetime(df["date"])
     df = df.sort_values(by="date", ascending=False)
-    
+    # Plain reference for the export section - boolean filtering below
+    # returns new frames, so no defensive .copy() is needed
+    df_original = df
+
+
     # --- 2. Key Metrics ---
     total_spend = df["amount"].sum()
     total_tax = df["tax"].sum()
@@ -165,7 +258,7 @@ def render_dashboard():
     
     # CSV Export
     with col1:
-        csv_data = df.to_csv(index=False).encode('utf-8')
+        csv_data = _csv_bytes(df_original)
         st.download_button(
             label="CSV",
             data=csv_data,
@@ -177,9 +270,19 @@ def render_dashboard():
     
     # Excel Export
     with col2:
+        # write_only mode streams rows instead of building styled Cell
+        # objects for the whole sheet - much faster and flat memory
+        import openpyxl  # type: ignore
         excel_buffer = io.BytesIO()
-        with pd.ExcelWriter(excel_buffer, engine='openpyxl') as writer:
-            df.to_excel(writer, index=False, sheet_name='Receipts')
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("Receipts")
+        export_df = df_original.assign(date=df_original["date"].dt.strftime("%Y-%m-%d"))
+        ws.append(list(export_df.columns))
+        for row in export_df.itertuples(index=False, name=None):
+            # openpyxl rejects pd.NA cells - write them as empty like
+            # to_excel did
+            ws.append(tuple(None if pd.isna(v) else v for v in row))
+        wb.save(excel_buffer)
         excel_buffer.seek(0)
         st.download_button(
             label="Excel",
@@ -193,10 +296,10 @@ def render_dashboard():
     # PDF Export
     with col3:
         try:
-            pdf_buffer = generate_pdf_report(df, lang)
+            pdf_data = generate_pdf_report(df_original, lang)
             st.download_button(
                 label="PDF",
-                data=pdf_buffer,
+                data=pdf_data,
                 file_name=f"receipt_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
                 mime="application/pdf",
                 use_container_width=True,
@@ -207,7 +310,7 @@ def render_dashboard():
     
     # JSON Export
     with col4:
-        json_data = df.to_json(orient='records', date_format='iso', indent=2)
+        json_data = _json_bytes(df_original)
         st.download_button(
             label="JSON",
             data=json_data,
@@ -223,8 +326,9 @@ def render_dashboard():
     st.subheader(get_text(lang, "stored_receipts_header"))
     
     # Selection/Delete
-    df_display = df.copy()
-    df_display.insert(0, "Select", False)
+    # assign() only allocates the new boolean column; the existing
+    # columns are shared with df rather than copied
+    df_display = df.assign(Select=False)[["Select", *df.columns]]
     
     edited_df = st.data_editor(
         df_display,
@@ -246,8 +350,13 @@ def render_dashboard():
         if st.button(get_text(lang, "delete_selected_btn"), type="secondary"):
             to_delete = edited_df[edited_df["Select"] == True]
             if not to_delete.empty:
-                for bid in to_delete["bill_id"]:
-                    delete_receipt(bid)
+                delete_receipts(to_delete["bill_id"].tolist())
+                _load_receipts_df.clear()
+                _csv_bytes.clear()
+                _json_bytes.clear()
+                generate_pdf_report.clear()
+                from ui.validation_ui import _bill_id_set
+                _bill_id_set.clear()
                 st.success(f"Deleted {len(to_delete)} receipts!")
                 st.rerun()
             else:
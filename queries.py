@@ -74,19 +74,55 @@ def receipt_exists(bill_id):
 
 
 # ================= FETCH ALL RECEIPTS =================
-def fetch_all_receipts() -> List[Dict[str, Any]]:
+def fetch_all_receipts(
+    bill_id: Optional[str] = None,
+    vendor: Optional[str] = None,
+    category: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
     """
-    Returns list of dicts ordered by date DESC
+    Returns list of dicts ordered by date DESC.
+    Optional filters are pushed into the WHERE clause so the DB only
+    returns matching rows instead of the whole table.
     """
     db = get_db()
-    
+
+    where = ""
+    params: List[Any] = []
+
+    if bill_id:
+        where += " AND lower(bill_id) LIKE ?"
+        params.append(f"%{bill_id.lower()}%")
+
+    if vendor:
+        where += " AND lower(vendor) LIKE ?"
+        params.append(f"%{vendor.lower()}%")
+
+    # The category predicate only applies to the primary query - the
+    # legacy-schema fallback exists because old DBs lack that column
+    cat_where = ""
+    cat_params: List[Any] = []
+    if category and category != "All":
+        cat_where = " AND category = ?"
+        cat_params.append(category)
+
+    suffix = " ORDER BY date DESC"
+    limit_params: List[Any] = []
+    if limit is not None:
+        suffix += " LIMIT ?"
+        limit_params.append(limit)
+
     try:
         cur = db.execute(
-            "SELECT bill_id, vendor, date, amount, tax, subtotal, category FROM receipts ORDER BY date DESC"
+            "SELECT bill_id, vendor, date, amount, tax, subtotal, category FROM receipts WHERE 1=1"
+            + where + cat_where + suffix,
+            params + cat_params + limit_params,
         )
     except:
         cur = db.execute(
-            "SELECT bill_id, vendor, date, amount, tax, 0.0 as subtotal, 'Uncategorized' as category FROM receipts ORDER BY date DESC"
+            "SELECT bill_id, vendor, date, amount, tax, 0.0 as subtotal, 'Uncategorized' as category FROM receipts WHERE 1=1"
+            + where + suffix,
+            params + limit_params,
         )
 
     rows = cur.fetchall()
@@ -222,6 +258,20 @@ def delete_receipt(bill_id):
     db.commit()
 
 
+# ================= DELETE MANY RECEIPTS =================
+def delete_receipts(bill_ids: List[str]):
+    """Delete multiple receipts in a single statement (one roundtrip)"""
+    if not bill_ids:
+        return
+    db = get_db()
+    placeholders = ", ".join("?" for _ in bill_ids)
+    db.execute(
+        f"DELETE FROM receipts WHERE bill_id IN ({placeholders})",
+        list(bill_ids),
+    )
+    db.commit()
+
+
 # ================= CLEAR ALL RECEIPTS =================
 def clear_all_receipts():
     db = get_db()
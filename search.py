@@ -7,6 +7,6 @@ def search_receipts(df: pd.DataFrame, keyword: str):
 
     keyword = keyword.lower()
     return df[
-        (df["vendor"].str.lower().str.contains(keyword, na=False)) |
-        (df["category"].str.lower().str.contains(keyword, na=False))
+        (df["vendor"].str.lower().str.contains(keyword, regex=False, na=False)) |
+        (df["category"].str.lower().str.contains(keyword, regex=False, na=False))
     ]
\ No newline at end of file
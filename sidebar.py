@@ -92,6 +92,15 @@ def render_sidebar():
             if st.button("🗑 Clear All Data", type="secondary", use_container_width=True):
                 if st.session_state.get("confirm_delete", False):
                     clear_all_receipts()
+                    # Invalidate the cached receipts frame so the wipe
+                    # is visible immediately, not after the TTL
+                    from ui.dashboard_ui import _load_receipts_df, _csv_bytes, _json_bytes, generate_pdf_report
+                    from ui.validation_ui import _bill_id_set
+                    _load_receipts_df.clear()
+                    _csv_bytes.clear()
+                    _json_bytes.clear()
+                    generate_pdf_report.clear()
+                    _bill_id_set.clear()
                     st.toast("All receipts deleted!", icon="🗑")
                     st.session_state["confirm_delete"] = False
                     st.rerun()
@@ -4,11 +4,21 @@ import pytesseract  # type: ignore
 import pandas as pd  # type: ignore
 
 from ocr.text_parser import parse_receipt  # type: ignore
-from ui.validation_ui import validate_receipt  # type: ignore
-from database.queries import save_receipt, receipt_exists  # type: ignore
+from ui.validation_ui import validate_receipt, _bill_id_set  # type: ignore
+from database.queries import save_receipt  # type: ignore
 from config.translations import get_text  # type: ignore
 
 
+@st.cache_resource
+def _gemini(api_key: str):
+    """
+    One GeminiClient per API key, reused across uploads/reruns so
+    each extraction doesn't pay SDK init + model discovery again.
+    """
+    from ai.gemini_client import GeminiClient
+    return GeminiClient(api_key)
+
+
 def render_upload_ui():
     lang = st.session_state.get("language", "en")
     st.header(get_text(lang, "upload_receipt_header"))
@@ -44,7 +54,11 @@ def render_upload_ui():
         st.image(img, caption=get_text(lang, "original_image"), use_container_width=True)
 
     with col2:
-        gray = img.convert("L")
+        # Downscale before grayscale - the preview is thumbnail-sized,
+        # so no need to convert the full-resolution photo
+        preview = img.copy()
+        preview.thumbnail((512, 512), Image.Resampling.LANCZOS)
+        gray = preview.convert("L")
         st.image(gray, caption=get_text(lang, "processed_image"), use_container_width=True)
 
     st.divider()
@@ -61,9 +75,8 @@ def render_upload_ui():
 
     with st.spinner(get_text(lang, "extracting_data")):
         if use_ai:
-            from ai.gemini_client import GeminiClient
             try:
-                client = GeminiClient(api_key)
+                client = _gemini(api_key)
                 # Gemini takes PIL image directly
                 result = client.extract_receipt(img)
                 if result:
@@ -76,12 +89,14 @@ def render_upload_ui():
 
         if not data:
             # Fallback to Tesseract
-            import numpy as np
-            import cv2
             # Use image_preprocessing if available
             from ocr.image_preprocessing import preprocess_image
-            gray_preprocessed = preprocess_image(img)
-            text = pytesseract.image_to_string(gray_preprocessed)
+            # Tesseract CPU time scales with pixel count - ~1600px is
+            # plenty for receipt text, so downsize huge photos first
+            work = img.copy()
+            work.thumbnail((1600, 1600), Image.Resampling.LANCZOS)
+            gray_preprocessed = preprocess_image(work)
+            text = pytesseract.image_to_string(gray_preprocessed, config="--oem 1 --psm 6")
             if not text.strip():
                 st.error(get_text(lang, "no_text_error"))
                 return
@@ -274,7 +289,7 @@ def render_upload_ui():
     st.divider()
 
     # ================= DUPLICATE CHECK & SAVE =================
-    if receipt_exists(data["bill_id"]):
+    if data["bill_id"] in _bill_id_set():
         st.error(get_text(lang, "duplicate_error"))
         return
     else:
@@ -286,6 +301,14 @@ def render_upload_ui():
     # Save receipt
     save_receipt(data)
 
+    # Invalidate cached receipt data so the new receipt shows up
+    from ui.dashboard_ui import _load_receipts_df, _csv_bytes, _json_bytes, generate_pdf_report
+    _load_receipts_df.clear()
+    _csv_bytes.clear()
+    _json_bytes.clear()
+    generate_pdf_report.clear()
+    _bill_id_set.clear()
+
     if validation["passed"]:
         st.success(get_text(lang, "validation_passed_save"))
     else:
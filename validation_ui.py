@@ -1,14 +1,25 @@
-from typing import Any, Dict  # type: ignore
+from typing import Any  # type: ignore
 import streamlit as st  # type: ignore
 from datetime import datetime  # type: ignore
-from database.queries import fetch_all_receipts, receipt_exists  # type: ignore
+from database.queries import fetch_all_receipts  # type: ignore
 from config.translations import get_text # type: ignore
 import pandas as pd # type: ignore
+import numpy as np # type: ignore
 
 EXPECTED_TAX_RATE = 0.08   # 8%
 TOLERANCE = 0.05           # 5% tolerance
 
 
+@st.cache_data
+def _bill_id_set() -> set:
+    """
+    Cached set of stored bill_ids so duplicate checks are O(1)
+    instead of one DB query per validated receipt.
+    Cleared after save/delete.
+    """
+    return {r["bill_id"] for r in fetch_all_receipts()}
+
+
 def validate_receipt(data: dict, skip_duplicate: bool = False) -> dict:
     results = []
     passed = True
@@ -88,23 +99,17 @@ def validate_receipt(data: dict, skip_duplicate: bool = False) -> dict:
             "message": "No tax applied"
         })
     else:
-        subtotal_option_1 = float(amount - tax)
-        subtotal_option_2 = float(amount)
-
         valid = False
         used_subtotal = 0.0
         actual_rate = 0.0
 
-        for subtotal in [subtotal_option_1, subtotal_option_2]:
-            subtotal = float(subtotal)
+        # amount/tax are already floats here, and subtotal > 0 rules
+        # out division by zero - no redundant casts or try/except
+        for subtotal in (amount - tax, amount):
             if subtotal <= 0:
                 continue
-            
-            try:
-                rate = float(tax) / subtotal
-            except ZeroDivisionError:
-                continue
 
+            rate = tax / subtotal
             if abs(rate - EXPECTED_TAX_RATE) <= TOLERANCE:
                 valid = True
                 used_subtotal = subtotal
@@ -133,7 +138,7 @@ def validate_receipt(data: dict, skip_duplicate: bool = False) -> dict:
 
     # ---------- Duplicate Detection ----------
     if not skip_duplicate:
-        if receipt_exists(data.get("bill_id")):
+        if data.get("bill_id") in _bill_id_set():
             results.append({
                 "status": "error",
                 "title": "Duplicate Detection",
@@ -195,35 +200,42 @@ def validation_ui():
     tax_input = c4.text_input("Tax")
 
     if st.button("Run Validation", use_container_width=True):
-        receipts = fetch_all_receipts()
+        from ui.dashboard_ui import _load_receipts_df
+        df = _load_receipts_df()
         match: dict[str, Any] | None = None
 
-        for r_raw in receipts:
-            r: Dict[str, Any] = r_raw
-            r_bill_id = str(r.get("bill_id", ""))
-            r_vendor = str(r.get("vendor", ""))
-            r_amount = float(r.get("amount", 0.0))
-            r_tax = float(r.get("tax", 0.0))
-
-            if bill_id and bill_id not in r_bill_id:
-                continue
-            if vendor and vendor.lower() not in r_vendor.lower():
-                continue
-            if amount_input:
-                try:
-                    if float(amount_input) != r_amount:
-                        continue
-                except ValueError:
-                    pass
-            if tax_input:
-                try:
-                    if float(tax_input) != r_tax:
-                        continue
-                except ValueError:
-                    pass
-
-            match = r
-            break
+        # Parse numeric inputs once (not per receipt)
+        try:
+            amount_filter = float(amount_input) if amount_input else None
+        except ValueError:
+            amount_filter = None
+        try:
+            tax_filter = float(tax_input) if tax_input else None
+        except ValueError:
+            tax_filter = None
+        vendor_lc = vendor.lower()
+
+        if not df.empty:
+            # Combine all filters into one numpy mask and apply it once
+            # instead of per-filter frame rebuilds / index realignment
+            mask = np.ones(len(df), dtype=bool)
+            if bill_id:
+                mask &= df["_bill_lc"].str.contains(bill_id.lower(), regex=False, na=False).to_numpy(dtype=bool)
+            if vendor_lc:
+                mask &= df["_vendor_lc"].str.contains(vendor_lc, regex=False, na=False).to_numpy(dtype=bool)
+            if amount_filter is not None:
+                mask &= df["amount"].to_numpy() == amount_filter
+            if tax_filter is not None:
+                mask &= df["tax"].to_numpy() == tax_filter
+
+            hits = np.flatnonzero(mask)
+            if hits.size:
+                match = df.iloc[hits[0]].to_dict()
+                match.pop("_bill_lc", None)
+                match.pop("_vendor_lc", None)
+                # Loader stores date as Timestamp; validation expects YYYY-MM-DD
+                if pd.notna(match.get("date")):
+                    match["date"] = pd.Timestamp(match["date"]).strftime("%Y-%m-%d")
 
         if match is None:
             st.error("No matching stored receipt found")